@@ -4,11 +4,16 @@ Add career/jobs tracking fields to the CSV schema
 """
 
 import csv
+import os
 from pathlib import Path
 
+# 1 MiB file buffers for reading/writing the CSV
+BUFFER_SIZE = 1 << 20
+
 def add_jobs_fields():
     script_dir = Path(__file__).parent
     csv_path = script_dir.parent / "data" / "datacenters.csv"
+    tmp_path = csv_path.with_suffix(csv_path.suffix + '.tmp')
 
     # New fields to add
     new_fields = [
@@ -18,28 +23,27 @@ def add_jobs_fields():
         'job_categories',
         'hiring_status'
     ]
-
-    # Read existing data
-    rows = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        header = reader.fieldnames
-        rows = list(reader)
-
-    # Insert new fields before 'notes'
-    notes_index = header.index('notes')
-    new_header = list(header[:notes_index]) + new_fields + [header[notes_index]]
-
-    # Write updated CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=new_header)
-        writer.writeheader()
-
-        for row in rows:
-            # Add empty values for new fields
-            for field in new_fields:
-                row[field] = ''
-            writer.writerow(row)
+    empty = [''] * len(new_fields)
+
+    # Stream rows into a temp file, splicing empty values in before 'notes'
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as src, \
+             open(tmp_path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+
+            header = next(reader)
+            notes_index = header.index('notes')
+            new_header = header[:notes_index] + new_fields + header[notes_index:]
+            writer.writerow(new_header)
+
+            writer.writerows(row[:notes_index] + empty + row[notes_index:] for row in reader if row)
+
+        # Swap in the new file only once it is fully written
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"✓ Added {len(new_fields)} career-related fields to CSV")
     print(f"  New fields: {', '.join(new_fields)}")
@@ -6,76 +6,167 @@ Preserves all fields and formats coordinates properly for mapping
 
 import csv
 import json
+import math
+import os
 import sys
+from operator import itemgetter
 from pathlib import Path
 
-def convert_to_number(value):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Columns converted to int/float in feature properties
+NUMERIC_FIELDS = frozenset([
+    'capacity_mw', 'year_opened', 'size_sqft', 'pue',
+    'renewable_energy_pct', 'water_usage_mgd', 'carbon_intensity_gco2_kwh',
+    'latency_zone_ms', 'min_commitment_months', 'nearest_university_miles'
+])
+
+COORDINATE_FIELDS = ('latitude', 'longitude')
+
+# Per-row dicts are shallow copies of these instead of fresh literals
+FEATURE_TEMPLATE = {"type": "Feature", "properties": None, "geometry": None}
+GEOM_TEMPLATE = {"type": "Point", "coordinates": None}
+
+# Output extensions written as newline-delimited GeoJSON (one Feature per line)
+NDJSON_SUFFIXES = ('.geojsonl', '.ndjson')
+
+# 1 MiB file buffers (default is 8 KiB)
+BUFFER_SIZE = 1 << 20
+
+def _to_num(value):
     """Convert string to int or float if possible, otherwise return original"""
-    if value == '' or value is None:
+    if not value:
         return None
-    try:
-        # Try int first
-        if '.' not in str(value):
+    # Values without a '.' are integers or text; decimals never go through int()
+    if '.' not in value:
+        try:
             return int(value)
-        return float(value)
-    except (ValueError, TypeError):
+        except ValueError:
+            return value
+    try:
+        number = float(value)
+    except ValueError:
         return value
+    # 'nan'/'inf' are not valid JSON numbers; keep the text as before
+    return number if math.isfinite(number) else value
+
+def _to_str(value):
+    """Keep as string, empty strings become None"""
+    return value or None
+
+def _dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json can encode
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _dumps_line(obj):
+    """Serialize to compact UTF-8 JSON bytes terminated by a newline"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return _dumps(obj) + b'\n'
+
+def _iter_features(reader, header):
+    """Yield a GeoJSON feature for each CSV row after header"""
+    width = len(header)
+    idx = {name: i for i, name in enumerate(header)}
+    NAME = idx.get('name')
+
+    # Classify columns once instead of per row, keeping CSV column order
+    keys = [key for key in header if key not in COORDINATE_FIELDS]
+    converters = [_to_num if key in NUMERIC_FIELDS else _to_str for key in keys]
+
+    # Pull whole rows apart in C rather than one lookup per column
+    get_coords = itemgetter(idx['latitude'], idx['longitude'])
+    get_values = itemgetter(*(idx[key] for key in keys))
+
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+
+        # Extract coordinates
+        lat, lon = map(_to_num, get_coords(row))
+
+        if lat is None or lon is None:
+            name = row[NAME] if NAME is not None else 'Unknown'
+            print(f"Warning: Skipping row with missing coordinates: {name}")
+            continue
+
+        properties = {
+            key: convert(value)
+            for key, convert, value in zip(keys, converters, get_values(row))
+        }
+        if len(row) > width:
+            # Cells beyond the header; json.dump wrote this key as "null"
+            properties['null'] = row[width:]
+
+        # Create GeoJSON feature
+        geometry = GEOM_TEMPLATE.copy()
+        geometry["coordinates"] = [lon, lat]  # GeoJSON uses [lon, lat] order
+        feature = FEATURE_TEMPLATE.copy()
+        feature["properties"] = properties
+        feature["geometry"] = geometry
+        yield feature
+
+def csv_to_geojson(csv_path, geojson_path, format=None):
+    """
+    Convert CSV to GeoJSON format, streaming one feature at a time
+
+    format is 'geojson' (a FeatureCollection) or 'ndjson' (bare Features,
+    one per line); by default it follows the extension of geojson_path.
+    """
+    if format is None:
+        format = 'ndjson' if Path(geojson_path).suffix in NDJSON_SUFFIXES else 'geojson'
+    if format not in ('geojson', 'ndjson'):
+        raise ValueError(f"Unknown output format: {format}")
+    ndjson = format == 'ndjson'
+    count = 0
+
+    # Write next to the target and rename at the end so readers never see a partial file
+    geojson_path = Path(geojson_path)
+    tmp_path = geojson_path.with_suffix(geojson_path.suffix + '.tmp')
 
-def csv_to_geojson(csv_path, geojson_path):
-    """Convert CSV to GeoJSON format"""
-    features = []
-
-    with open(csv_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-
-        for row in reader:
-            # Extract coordinates
-            lat = convert_to_number(row.pop('latitude'))
-            lon = convert_to_number(row.pop('longitude'))
-
-            if lat is None or lon is None:
-                print(f"Warning: Skipping row with missing coordinates: {row.get('name', 'Unknown')}")
-                continue
-
-            # Convert numeric fields
-            numeric_fields = [
-                'capacity_mw', 'year_opened', 'size_sqft', 'pue',
-                'renewable_energy_pct', 'water_usage_mgd', 'carbon_intensity_gco2_kwh',
-                'latency_zone_ms', 'min_commitment_months', 'nearest_university_miles'
-            ]
-
-            properties = {}
-            for key, value in row.items():
-                if key in numeric_fields:
-                    properties[key] = convert_to_number(value)
+    try:
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as csvfile, \
+             open(tmp_path, 'wb', buffering=BUFFER_SIZE) as f:
+            reader = csv.reader(csvfile)
+
+            # An empty file has no header and no rows: write an empty collection
+            header = next(reader, None)
+            features = _iter_features(reader, header) if header is not None else ()
+
+            # Write the FeatureCollection envelope up front; features follow
+            if not ndjson:
+                f.write(b'{"type":"FeatureCollection","name":"datacenters","features":[')
+
+            for feature in features:
+                # Compact output, one feature per line
+                if ndjson:
+                    f.write(_dumps_line(feature))
                 else:
-                    # Keep as string, empty strings become empty
-                    properties[key] = value if value != '' else None
-
-            # Create GeoJSON feature
-            feature = {
-                "type": "Feature",
-                "properties": properties,
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [lon, lat]  # GeoJSON uses [lon, lat] order
-                }
-            }
-
-            features.append(feature)
-
-    # Create GeoJSON FeatureCollection
-    geojson = {
-        "type": "FeatureCollection",
-        "name": "datacenters",
-        "features": features
-    }
-
-    # Write to file with nice formatting
-    with open(geojson_path, 'w', encoding='utf-8') as f:
-        json.dump(geojson, f, indent=2, ensure_ascii=False)
-
-    print(f"✓ Converted {len(features)} data centers from CSV to GeoJSON")
+                    f.write((b',\n' if count else b'\n') + _dumps(feature))
+                count += 1
+
+            if not ndjson:
+                f.write(b'\n]}\n')
+
+        os.replace(tmp_path, geojson_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    print(f"✓ Converted {count} data centers from CSV to {'NDJSON' if ndjson else 'GeoJSON'}")
     print(f"  Input:  {csv_path}")
     print(f"  Output: {geojson_path}")
 
@@ -88,6 +179,10 @@ if __name__ == "__main__":
     csv_path = project_root / "data" / "datacenters.csv"
     geojson_path = project_root / "data" / "datacenters.geojson"
 
+    # --ndjson writes newline-delimited features for streaming clients
+    if '--ndjson' in sys.argv[1:]:
+        geojson_path = geojson_path.with_suffix('.geojsonl')
+
     # Check if CSV exists
     if not csv_path.exists():
         print(f"Error: CSV file not found at {csv_path}")
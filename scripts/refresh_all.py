@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Refresh career data in datacenters.csv and regenerate jobs.json in one pass
+
+Combines add_jobs_fields.py, scrape_careers.py's update_csv_with_careers()
+and generate_jobs_json(): the CSV is read once and both outputs are
+written from the same rows.
+"""
+
+import csv
+import os
+import sys
+from pathlib import Path
+
+from scrape_careers import (
+    BUFFER_SIZE, CAREER_FIELDS, career_assigner, career_values, dumps_json, jobs_entry,
+    lookup_careers
+)
+
+def refresh_all(csv_path, jobs_json_path, pretty=False):
+    """Add missing career columns, fill them in, and write jobs.json"""
+    csv_path = Path(csv_path)
+    jobs_json_path = Path(jobs_json_path)
+    csv_tmp = csv_path.with_suffix(csv_path.suffix + '.tmp')
+    jobs_tmp = jobs_json_path.with_suffix(jobs_json_path.suffix + '.tmp')
+
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as src:
+        reader = csv.reader(src)
+        header = next(reader)
+        width = len(header)
+        rows = [row for row in reader if row]
+
+    # Schema migration: splice missing career columns in before 'notes'
+    missing = [f for f in CAREER_FIELDS if f not in header]
+    insert_at = header.index('notes') if 'notes' in header else width
+    empty = [''] * len(missing)
+    if missing:
+        header = header[:insert_at] + missing + header[insert_at:]
+        print(f"  + Added career fields: {', '.join(missing)}")
+
+    for row in rows:
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        if missing:
+            row[insert_at:insert_at] = empty
+
+    idx = {name: i for i, name in enumerate(header)}
+    ID, OPERATOR, CITY, STATE = idx['id'], idx['operator'], idx['city'], idx['state']
+    assign_careers = career_assigner(header)
+
+    # Same concurrent, deduplicated lookup as update_csv_with_careers
+    results = lookup_careers(
+        (row[OPERATOR], row[CITY], row[STATE]) for row in rows if row[OPERATOR]
+    )
+
+    updated = 0
+    jobs_data = {}
+    for row in rows:
+        facility_id = row[ID]
+        operator = row[OPERATOR]
+        city = row[CITY]
+        state = row[STATE]
+
+        if operator:
+            job_data = results[operator, city, state]
+            assign_careers(row, career_values(job_data))
+            updated += 1
+
+            # A dict, like generate_jobs_json: a repeated id keeps the last row
+            if facility_id:
+                jobs_data[facility_id] = jobs_entry(operator, city, state, job_data)
+
+    try:
+        with open(csv_tmp, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        with open(jobs_tmp, 'wb', buffering=BUFFER_SIZE) as f:
+            f.write(dumps_json(jobs_data, pretty=pretty))
+
+        # Swap both files in only once both are fully written
+        os.replace(csv_tmp, csv_path)
+        os.replace(jobs_tmp, jobs_json_path)
+    except BaseException:
+        csv_tmp.unlink(missing_ok=True)
+        jobs_tmp.unlink(missing_ok=True)
+        raise
+
+    print(f"✓ Updated {updated} facilities with career data")
+    print(f"✓ Generated jobs data: {jobs_json_path}")
+    print(f"  {len(jobs_data)} facilities with career information")
+
+if __name__ == "__main__":
+    script_dir = Path(__file__).parent
+    csv_path = script_dir.parent / "data" / "datacenters.csv"
+    jobs_json_path = script_dir.parent / "data" / "jobs.json"
+
+    if not csv_path.exists():
+        print(f"Error: CSV file not found at {csv_path}")
+        sys.exit(1)
+
+    # --pretty indents jobs.json, as with scrape_careers.py
+    pretty = '--pretty' in sys.argv[1:]
+
+    print("🔄 Refreshing career data")
+    print("=" * 50)
+    refresh_all(csv_path, jobs_json_path, pretty=pretty)
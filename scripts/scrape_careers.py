@@ -12,10 +12,32 @@ Sources:
 
 import json
 import csv
-from datetime import datetime
+import os
+import string
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import quote_plus
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# File buffer size for CSV/JSON reads and writes
+BUFFER_SIZE = 1 << 20
+
+# One UTC timestamp shared by every lookup in this run, e.g. 2025-10-14T09:30:00Z
+RUN_TIMESTAMP = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+# Concurrent lookups; scraping is network-bound once it hits real sites
+MAX_WORKERS = 32
+
+# Career columns in datacenters.csv, in schema order
+CAREER_FIELDS = ['careers_page_url', 'jobs_last_checked', 'open_positions_count', 'job_categories', 'hiring_status']
+
 # Example career page patterns for major operators
 CAREER_PAGES = {
     'Amazon Web Services': {
@@ -66,6 +88,15 @@ AGGREGATOR_PATTERNS = {
     'glassdoor': 'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={operator}%20{city}&locT=C&locId={city}',
 }
 
+def _compile_pattern(pattern):
+    """Split a format pattern into (literal, field name or None) parts"""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(pattern))
+
+# Patterns parsed once at import instead of by str.format on every call
+_COMPILED_AGGREGATORS = {
+    name: _compile_pattern(pattern) for name, pattern in AGGREGATOR_PATTERNS.items()
+}
+
 def get_career_page_url(operator, city=None, state=None):
     """Generate career page URL for an operator"""
     if operator in CAREER_PAGES:
@@ -79,16 +110,25 @@ def get_career_page_url(operator, city=None, state=None):
 
 def get_aggregator_urls(operator, city, state):
     """Generate job aggregator URLs"""
+    args = {
+        'operator': quote_plus(operator),
+        'city': quote_plus(city),
+        'state': state
+    }
     urls = {}
-    for name, pattern in AGGREGATOR_PATTERNS.items():
-        url = pattern.format(
-            operator=quote_plus(operator),
-            city=quote_plus(city),
-            state=state
+    for name, parts in _COMPILED_AGGREGATORS.items():
+        urls[name] = ''.join(
+            literal + (args[field] if field is not None else '') for literal, field in parts
         )
-        urls[name] = url
     return urls
 
+@lru_cache(maxsize=4096)
+def _build_urls(operator, city, state):
+    """Career and aggregator URLs for an operator/location, built once per triple"""
+    career_url = get_career_page_url(operator, city, state)
+    aggregator_urls = tuple(get_aggregator_urls(operator, city, state).items()) if city and state else ()
+    return career_url, aggregator_urls
+
 def scrape_operator_jobs(operator, city=None, state=None):
     """
     Scrape jobs for a specific operator/location
@@ -99,16 +139,15 @@ def scrape_operator_jobs(operator, city=None, state=None):
     3. Cache results for performance
     4. Return structured job data
     """
-    career_url = get_career_page_url(operator, city, state)
-    aggregator_urls = get_aggregator_urls(operator, city, state) if city and state else {}
+    career_url, aggregator_urls = _build_urls(operator, city, state)
 
     # Mock data structure that would be returned
     result = {
         'operator': operator,
         'location': f"{city}, {state}" if city and state else "All locations",
         'career_page': career_url,
-        'aggregator_urls': aggregator_urls,
-        'last_checked': datetime.now().isoformat(),
+        'aggregator_urls': dict(aggregator_urls),
+        'last_checked': RUN_TIMESTAMP,
         'jobs_found': 0,  # Would be populated by actual scraping
         'job_categories': [],  # e.g., ["Engineering", "Operations", "Sustainability"]
         'hiring_status': 'Unknown',  # Active / Limited / Not Hiring
@@ -117,81 +156,160 @@ def scrape_operator_jobs(operator, city=None, state=None):
 
     return result
 
+def career_values(job_data):
+    """CSV values for CAREER_FIELDS, in order, from a scrape result"""
+    return (
+        job_data['career_page'] or '',
+        job_data['last_checked'],
+        str(job_data['jobs_found']),
+        ','.join(job_data['job_categories']),
+        job_data['hiring_status']
+    )
+
+def lookup_careers(keys):
+    """
+    Scrape each distinct (operator, city, state) in keys once, concurrently
+    Returns a dict mapping each triple to its scrape result
+    """
+    unique = list(dict.fromkeys(keys))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(zip(unique, executor.map(lambda key: scrape_operator_jobs(*key), unique)))
+
+def career_assigner(header):
+    """Return a function that writes CAREER_FIELDS values into a row list"""
+    positions = [header.index(f) for f in CAREER_FIELDS]
+    start = positions[0]
+    end = start + len(positions)
+
+    if positions == list(range(start, end)):
+        # Usual layout (see add_jobs_fields.py): one slice assignment per row
+        def assign(row, values):
+            row[start:end] = values
+    else:
+        def assign(row, values):
+            for i, value in zip(positions, values):
+                row[i] = value
+    return assign
+
 def update_csv_with_careers(csv_path):
     """
     Update CSV with career data
     Reads existing data, scrapes jobs, adds career fields
     """
     rows = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        header = list(reader.fieldnames)
-        rows = list(reader)
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
 
     # Check if career fields exist
-    career_fields = ['careers_page_url', 'jobs_last_checked', 'open_positions_count', 'job_categories', 'hiring_status']
-    has_career_fields = all(f in header for f in career_fields)
+    missing = set(CAREER_FIELDS).difference(header)
 
-    if not has_career_fields:
-        print("❌ CSV missing career fields. Add them first.")
+    if missing:
+        print(f"❌ CSV missing career fields: {', '.join(f for f in CAREER_FIELDS if f in missing)}. Add them first.")
         return
 
+    # Resolve column positions once; rows are plain lists
+    idx = {name: i for i, name in enumerate(header)}
+    OPERATOR, CITY, STATE = idx['operator'], idx['city'], idx['state']
+    assign_careers = career_assigner(header)
+
+    for row in rows:
+        if len(row) < len(header):
+            row.extend([''] * (len(header) - len(row)))
+
+    # Look up each distinct operator/location once, concurrently
+    results = lookup_careers(
+        (row[OPERATOR], row[CITY], row[STATE]) for row in rows if row[OPERATOR]
+    )
+
     # Update each row with career data
     updated = 0
     for row in rows:
-        operator = row.get('operator')
-        city = row.get('city')
-        state = row.get('state')
+        operator = row[OPERATOR]
+        city = row[CITY]
+        state = row[STATE]
 
         if operator:
-            job_data = scrape_operator_jobs(operator, city, state)
-            row['careers_page_url'] = job_data['career_page'] or ''
-            row['jobs_last_checked'] = job_data['last_checked']
-            row['open_positions_count'] = str(job_data['jobs_found'])
-            row['job_categories'] = ','.join(job_data['job_categories'])
-            row['hiring_status'] = job_data['hiring_status']
+            assign_careers(row, career_values(results[operator, city, state]))
             updated += 1
             print(f"  ✓ Updated careers for {operator}")
 
-    # Write back
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Write back via a temp file so an interrupted run leaves the CSV intact
+    csv_path = Path(csv_path)
+    tmp_path = csv_path.with_suffix(csv_path.suffix + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"\n✓ Updated {updated} facilities with career data")
 
-def generate_jobs_json(csv_path, output_path):
+def dumps_json(obj, pretty=False):
+    """Serialize to UTF-8 JSON bytes, compact unless pretty is set"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which json can encode
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def jobs_entry(operator, city, state, job_info):
+    """jobs.json record for one facility"""
+    return {
+        'operator': operator,
+        'location': f"{city}, {state}",
+        'career_page': job_info['career_page'],
+        'aggregator_urls': job_info['aggregator_urls'],
+        'open_positions': job_info['jobs_found'],
+        'last_updated': job_info['last_checked'],
+        'hiring_status': job_info['hiring_status']
+    }
+
+def generate_jobs_json(csv_path, output_path, pretty=False):
     """
     Generate a jobs.json file for real-time map integration
     This would be regenerated periodically (daily/weekly)
+    Output is compact unless pretty=True
     """
-    rows = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
     jobs_data = {}
-    for row in rows:
-        facility_id = row.get('id')
-        operator = row.get('operator')
-        city = row.get('city')
-        state = row.get('state')
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        # An empty file has no header and no rows: jobs.json is just {}
+        header = next(reader, None) or ['id', 'operator', 'city', 'state']
+        idx = {name: i for i, name in enumerate(header)}
+        get_fields = itemgetter(idx['id'], idx['operator'], idx['city'], idx['state'])
+        width = max(idx['id'], idx['operator'], idx['city'], idx['state']) + 1
+
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+            rows.append(get_fields(row))
 
+    for facility_id, operator, city, state in rows:
         if facility_id and operator:
             job_info = scrape_operator_jobs(operator, city, state)
-            jobs_data[facility_id] = {
-                'operator': operator,
-                'location': f"{city}, {state}",
-                'career_page': job_info['career_page'],
-                'aggregator_urls': job_info['aggregator_urls'],
-                'open_positions': job_info['jobs_found'],
-                'last_updated': job_info['last_checked'],
-                'hiring_status': job_info['hiring_status']
-            }
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(jobs_data, f, indent=2)
+            jobs_data[facility_id] = jobs_entry(operator, city, state, job_info)
+
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    try:
+        with open(tmp_path, 'wb', buffering=BUFFER_SIZE) as f:
+            f.write(dumps_json(jobs_data, pretty=pretty))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"✓ Generated jobs data: {output_path}")
     print(f"  {len(jobs_data)} facilities with career information")
@@ -203,12 +321,15 @@ if __name__ == "__main__":
     csv_path = script_dir.parent / "data" / "datacenters.csv"
     jobs_json_path = script_dir.parent / "data" / "jobs.json"
 
+    # --pretty indents jobs.json for reading; the default is compact for the map
+    pretty = '--pretty' in sys.argv[1:]
+
     print("📊 Data Center Jobs Scraper")
     print("=" * 50)
 
     # For now, just generate the jobs.json as proof of concept
     print("\nGenerating jobs data (proof-of-concept)...")
-    generate_jobs_json(csv_path, jobs_json_path)
+    generate_jobs_json(csv_path, jobs_json_path, pretty=pretty)
 
     print("\n💡 Integration:")
     print("  - jobs.json can be loaded by the map")